@@ -0,0 +1,67 @@
+import sys
+import os
+
+# Add the src directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import plotly.express as px
+import streamlit as st
+
+import results_store as rs
+
+# Launch with: streamlit run src/dashboard.py
+
+
+# Results tables are precomputed by run.py, so they are cached instead of re-running the backtest on each page load.
+# The ttl picks up aggregates rebuilt under the same run_id.
+@st.cache_data(ttl=60)
+def load_table(run_id, name, ticker=None):
+    return rs.load_run_table(run_id, name, ticker=ticker)
+
+
+@st.cache_data(ttl=60)
+def load_runs():
+    return rs.list_runs()
+
+
+st.set_page_config(page_title='Cutting Hedge Results', layout='wide')
+st.title('Backtest Results')
+
+runs = load_runs()
+if not runs:
+    st.info('No results found in data/results. Run src/run.py to generate results.')
+    st.stop()
+
+run_id = st.sidebar.selectbox('Run', runs)
+
+# Run overview - one row per ticker
+stats = load_table(run_id, 'stats').set_index('Ticker')
+metrics = load_table(run_id, 'metrics').set_index('Ticker')
+
+st.header(f'Run {run_id}')
+st.subheader('Backtest Stats')
+st.dataframe(stats, width='stretch')
+st.subheader('Model Evaluation Metrics')
+st.dataframe(metrics, width='stretch')
+
+# Ticker detail
+ticker = st.sidebar.selectbox('Ticker', stats.index.tolist())
+st.header(ticker)
+
+equity = load_table(run_id, 'equity', ticker=ticker)
+fig = px.line(equity, x='Date', y='Value', title='Equity Curve', template='plotly_dark')
+st.plotly_chart(fig, width='stretch')
+
+left, right = st.columns(2)
+
+with left:
+    st.subheader('Backtest Stats')
+    st.dataframe(stats.loc[ticker].astype(str).rename('Value'), width='stretch')
+    st.subheader('Model Evaluation Metrics')
+    st.dataframe(metrics.loc[ticker].rename('Value'), width='stretch')
+
+with right:
+    feature_importances = load_table(run_id, 'feature_importance', ticker=ticker).sort_values('Importance')
+    fig = px.bar(feature_importances, x='Importance', y='Feature', orientation='h',
+                 title='Feature Importance', template='plotly_dark')
+    st.plotly_chart(fig, width='stretch')
@@ -1,22 +1,44 @@
 import pandas as pd
 import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
-from sklearn.ensemble import RandomForestRegressor
 from sklearn.inspection import permutation_importance
 
-def calculate_feature_importance(model, X):
+def has_builtin_feature_importance(model):
+    """
+    Check whether the model provides built-in feature importances (feature_importances_ or coef_).
+    
+    Parameters:
+    model: Trained model.
+    
+    Returns:
+    bool: True if calculate_feature_importance does not need the permutation importance fallback.
+    """
+    return hasattr(model, 'feature_importances_') or hasattr(model, 'coef_')
+
+def calculate_feature_importance(model, X, y=None):
     """
     Calculate feature importance using the model's built-in feature importance.
     
+    Tree ensembles use feature_importances_, linear models use the absolute coefficients.
+    Models without either (e.g. HistGradientBoostingRegressor) fall back to permutation importance,
+    which requires y.
+    
     Parameters:
     model: Trained model.
     X (pd.DataFrame): Features.
+    y (pd.Series): Target variable, only used for the permutation importance fallback.
     
     Returns:
     pd.Series: Feature importances.
     """
-    feature_importances = pd.Series(model.feature_importances_, index=X.columns)
-    return feature_importances
+    if hasattr(model, 'feature_importances_'):
+        return pd.Series(model.feature_importances_, index=X.columns)
+    if hasattr(model, 'coef_'):
+        return pd.Series(np.abs(np.ravel(model.coef_)), index=X.columns)
+    if y is None:
+        raise ValueError(f"{type(model).__name__} has no built-in feature importance; pass y to use permutation importance")
+    return calculate_permutation_importance(model, X, y)
 
 def calculate_permutation_importance(model, X, y, n_repeats=30, random_state=42):
     """
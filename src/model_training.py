@@ -1,14 +1,19 @@
-from sklearn.ensemble import RandomForestRegressor
+import numbers
+import warnings
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
+from sklearn.linear_model import ElasticNet
 from sklearn.model_selection import train_test_split
+from threadpoolctl import threadpool_limits
 
 
-def prepare_data(df, target_column='Daily Return'):
+def prepare_data(df, target_column='Daily Return', dtype=None):
     """
     Prepare data for training by defining features and target.
     
     Parameters:
     df (pd.DataFrame): Dataframe containing features and target.
     target_column (str): Name of the target column.
+    dtype (str or np.dtype): Optional dtype to cast features and target to (e.g., 'float32').
     
     Returns:
     X (pd.DataFrame): Features.
@@ -16,10 +21,154 @@ def prepare_data(df, target_column='Daily Return'):
     """
     X = df.drop(columns=[target_column])
     y = df[target_column]
+    if dtype is not None:
+        X = X.astype(dtype)
+        y = y.astype(dtype)
     return X, y
 
 
-def train_random_forest(X, y, test_size=0.2, random_state=42, n_estimators=100):
+def _build_random_forest(random_state, n_jobs, n_estimators=100, **params):
+    return RandomForestRegressor(n_estimators=n_estimators, random_state=random_state, n_jobs=n_jobs, **params)
+
+
+class _ThreadLimitedMixin:
+    # Limits fit/predict to n_jobs threads for estimators without an n_jobs argument. n_jobs is a plain
+    # attribute set by the builder, so it is not part of get_params and the estimator keeps sklearn's API.
+    n_jobs = None
+    user_api = None
+
+    def _thread_limits(self):
+        limits = self.n_jobs if self.n_jobs is not None and self.n_jobs > 0 else None
+        return threadpool_limits(limits=limits, user_api=self.user_api)
+
+    def fit(self, X, y, *args, **kwargs):
+        with self._thread_limits():
+            return super().fit(X, y, *args, **kwargs)
+
+    def predict(self, X):
+        with self._thread_limits():
+            return super().predict(X)
+
+
+class ThreadLimitedHistGradientBoostingRegressor(_ThreadLimitedMixin, HistGradientBoostingRegressor):
+    user_api = 'openmp'
+
+
+class ThreadLimitedElasticNet(_ThreadLimitedMixin, ElasticNet):
+    user_api = 'blas'
+
+
+def _build_hist_gradient_boosting(random_state, n_jobs, max_iter=100, warm_start=False, **params):
+    # sklearn only supports warm_start when refitting on the same data, so refit_model
+    # always refits this backend from scratch on the new window
+    if warm_start:
+        warnings.warn("hist_gradient_boosting ignores warm_start; refit_model refits it from scratch")
+    model = ThreadLimitedHistGradientBoostingRegressor(max_iter=max_iter, random_state=random_state, **params)
+    model.n_jobs = n_jobs
+    return model
+
+
+def _build_elastic_net(random_state, n_jobs, alpha=1e-3, l1_ratio=0.5, **params):
+    model = ThreadLimitedElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=random_state, **params)
+    model.n_jobs = n_jobs
+    return model
+
+
+# Available model backends: name -> builder
+MODEL_BACKENDS = {
+    'random_forest': _build_random_forest,
+    'hist_gradient_boosting': _build_hist_gradient_boosting,
+    'elastic_net': _build_elastic_net,
+}
+
+
+def build_model(model_type='random_forest', random_state=42, n_jobs=-1, warm_start=False, **params):
+    """
+    Build an unfitted model for one of the available backends.
+
+    Parameters:
+    model_type (str): One of the keys of MODEL_BACKENDS.
+    random_state (int): Random seed.
+    n_jobs (int): Number of CPU cores to use (-1 for all). hist_gradient_boosting and elastic_net
+                  limit their OpenMP/BLAS threads to n_jobs during fit and predict.
+    warm_start (bool): Keep the fitted state between calls to fit so the model can be refitted incrementally.
+                       Ignored (with a warning) by hist_gradient_boosting, which refit_model always refits from scratch.
+    **params: Additional keyword arguments passed to the underlying estimator.
+
+    Returns:
+    model: Unfitted model.
+    """
+    if model_type not in MODEL_BACKENDS:
+        raise ValueError(f"Unknown model_type '{model_type}'. Available: {', '.join(MODEL_BACKENDS)}")
+    builder = MODEL_BACKENDS[model_type]
+    return builder(random_state, n_jobs, warm_start=warm_start, **params)
+
+
+def train_model(X, y, model_type='random_forest', test_size=0.2, random_state=42, n_jobs=-1, warm_start=False,
+                **params):
+    """
+    Train a model using one of the available backends.
+
+    Parameters:
+    X (pd.DataFrame): Features.
+    y (pd.Series): Target variable.
+    model_type (str): One of the keys of MODEL_BACKENDS ('random_forest', 'hist_gradient_boosting', 'elastic_net').
+    test_size (float): Proportion of the dataset to include in the test split.
+    random_state (int): Random seed.
+    n_jobs (int): Number of CPU cores to use (-1 for all).
+    warm_start (bool): Build the model so it can later be updated with refit_model.
+    **params: Additional keyword arguments passed to the underlying estimator.
+
+    Returns:
+    model: Trained model.
+    X_train, X_test, y_train, y_test: Train-test split data.
+    """
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
+    model = build_model(model_type, random_state=random_state, n_jobs=n_jobs, warm_start=warm_start, **params)
+    model.fit(X_train, y_train)
+    return model, X_train, X_test, y_train, y_test
+
+
+def refit_model(model, X, y, n_new_estimators=10):
+    """
+    Refit a model on a new training window, e.g. when a walk-forward window advances by a few bars.
+
+    - random_forest (warm_start=True): fits n_new_estimators trees on the new window and drops the
+      n_new_estimators oldest trees, so the forest keeps a fixed size and rolls towards the current window.
+    - elastic_net: with warm_start=True the solver restarts from the previous coefficients.
+    - hist_gradient_boosting: always refitted from scratch, as sklearn's warm start is only valid on the same data.
+
+    Parameters:
+    model: Trained model.
+    X (pd.DataFrame): Features of the new training window.
+    y (pd.Series): Target variable of the new training window.
+    n_new_estimators (int): Number of trees to replace for the random forest backend.
+
+    Returns:
+    model: Refitted model.
+    """
+    if isinstance(model, RandomForestRegressor):
+        if not model.warm_start:
+            raise ValueError("refit_model requires a random forest built with warm_start=True")
+        if not 0 < n_new_estimators <= model.n_estimators:
+            raise ValueError(f"n_new_estimators must be between 1 and n_estimators ({model.n_estimators})")
+        n_estimators = model.n_estimators
+        # sklearn derives the seeds of new trees from random_state and the current forest size, which stays
+        # fixed here, so advance an integer seed to avoid reusing the previous refit's bootstrap samples
+        if isinstance(model.random_state, numbers.Integral):
+            model.set_params(random_state=int(model.random_state) + 1)
+        model.set_params(n_estimators=n_estimators + n_new_estimators)
+        try:
+            model.fit(X, y)
+            model.estimators_ = model.estimators_[n_new_estimators:]
+        finally:
+            model.set_params(n_estimators=n_estimators)
+    else:
+        model.fit(X, y)
+    return model
+
+
+def train_random_forest(X, y, test_size=0.2, random_state=42, n_estimators=100, n_jobs=None):
     """
     Train a Random Forest model.
     
@@ -29,12 +178,11 @@ def train_random_forest(X, y, test_size=0.2, random_state=42, n_estimators=100):
     test_size (float): Proportion of the dataset to include in the test split.
     random_state (int): Random seed.
     n_estimators (int): Number of trees in the forest.
+    n_jobs (int): Number of CPU cores to use (-1 for all).
     
     Returns:
     model: Trained Random Forest model.
     X_train, X_test, y_train, y_test: Train-test split data.
     """
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
-    model = RandomForestRegressor(n_estimators=n_estimators, random_state=random_state)
-    model.fit(X_train, y_train)
-    return model, X_train, X_test, y_train, y_test
\ No newline at end of file
+    return train_model(X, y, model_type='random_forest', test_size=test_size, random_state=random_state,
+                       n_jobs=n_jobs, n_estimators=n_estimators)
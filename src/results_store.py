@@ -0,0 +1,159 @@
+import os
+import numpy as np
+import pandas as pd
+
+# Tables kept per ticker and aggregated per run
+RESULT_TABLES = ['stats', 'metrics', 'feature_importance', 'equity']
+
+# Written once all tables of a ticker are saved; ticker directories without it are skipped when aggregating
+COMPLETE_MARKER = '_COMPLETE'
+
+
+def _ticker_dir(store_dir, run_id, ticker):
+    return os.path.join(store_dir, run_id, 'tickers', ticker)
+
+
+def downsample_series(series, max_points=500):
+    """
+    Downsample a time series to at most max_points evenly spaced points, always keeping the last point.
+
+    Parameters:
+    series (pd.Series): Series to downsample.
+    max_points (int): Maximum number of points to keep.
+
+    Returns:
+    pd.Series: Downsampled series.
+    """
+    if len(series) <= max_points:
+        return series
+    positions = np.unique(np.linspace(0, len(series) - 1, max_points).round().astype(int))
+    return series.iloc[positions]
+
+
+def _stats_to_frame(stats, ticker):
+    """
+    Convert portfolio.stats() output to a single-row DataFrame that can be written to parquet.
+    Durations are stored as a number of days, missing values (NaT, e.g. durations without trades) as NaN.
+    """
+    record = {}
+    durations = []
+    for name, value in stats.items():
+        if value is pd.NaT or isinstance(value, pd.Timedelta):
+            value = np.nan if value is pd.NaT else value.total_seconds() / 86400
+            durations.append(name)
+        record[name] = value
+    frame = pd.DataFrame([{'Ticker': ticker, **record}])
+    frame[durations] = frame[durations].astype(float)
+    return frame
+
+
+def save_ticker_results(run_id, ticker, portfolio, metrics, feature_importances, store_dir='data/results', max_points=500):
+    """
+    Save backtest stats, equity curve, evaluation metrics and feature importances for one ticker of a run.
+
+    Parameters:
+    run_id (str): Identifier of the run.
+    ticker (str): Ticker symbol of the stock.
+    portfolio (vbt.Portfolio): vectorbt Portfolio object with backtest results.
+    metrics (dict): Evaluation metrics returned by evaluate_model.
+    feature_importances (pd.Series): Feature importances.
+    store_dir (str): Root directory of the results store.
+    max_points (int): Maximum number of points kept for the equity curve.
+
+    Returns:
+    str: Directory the results were saved to.
+    """
+    ticker_dir = _ticker_dir(store_dir, run_id, ticker)
+    os.makedirs(ticker_dir, exist_ok=True)
+    marker_path = os.path.join(ticker_dir, COMPLETE_MARKER)
+    if os.path.exists(marker_path):
+        os.remove(marker_path)
+
+    stats = _stats_to_frame(portfolio.stats(), ticker)
+
+    metrics = pd.DataFrame([{'Ticker': ticker, **metrics}])
+
+    feature_importances = feature_importances.rename_axis('Feature').rename('Importance').reset_index()
+    feature_importances.insert(0, 'Ticker', ticker)
+
+    equity = downsample_series(portfolio.value(), max_points)
+    equity = pd.DataFrame({'Ticker': ticker, 'Date': equity.index, 'Value': equity.values})
+
+    tables = {'stats': stats, 'metrics': metrics, 'feature_importance': feature_importances, 'equity': equity}
+    for name, table in tables.items():
+        table.to_parquet(os.path.join(ticker_dir, f'{name}.parquet'), index=False)
+    open(marker_path, 'w').close()
+
+    return ticker_dir
+
+
+def build_run_aggregates(run_id, store_dir='data/results'):
+    """
+    Combine the per-ticker results of a run into one parquet file per table, so the dashboard
+    reads a handful of files instead of one set per ticker.
+
+    Reads every ticker of the run, so call it once after all tickers are saved rather than after each one.
+    Tickers whose results are incomplete (e.g. crashed or still running) are skipped.
+
+    Parameters:
+    run_id (str): Identifier of the run.
+    store_dir (str): Root directory of the results store.
+
+    Returns:
+    dict: Aggregated DataFrames keyed by table name.
+    """
+    tickers_dir = os.path.join(store_dir, run_id, 'tickers')
+    tickers = sorted(ticker for ticker in os.listdir(tickers_dir)
+                     if os.path.exists(os.path.join(tickers_dir, ticker, COMPLETE_MARKER)))
+    if not tickers:
+        raise ValueError(f"No complete ticker results found for run '{run_id}'")
+
+    aggregates = {}
+    for name in RESULT_TABLES:
+        frames = [pd.read_parquet(os.path.join(tickers_dir, ticker, f'{name}.parquet')) for ticker in tickers]
+        aggregates[name] = pd.concat(frames, ignore_index=True)
+        aggregates[name].to_parquet(os.path.join(store_dir, run_id, f'{name}.parquet'), index=False)
+
+    return aggregates
+
+
+def list_runs(store_dir='data/results'):
+    """
+    List the runs that have aggregated results, most recently aggregated first.
+
+    Parameters:
+    store_dir (str): Root directory of the results store.
+
+    Returns:
+    list: Run identifiers.
+    """
+    if not os.path.isdir(store_dir):
+        return []
+    stats_paths = {run_id: os.path.join(store_dir, run_id, 'stats.parquet') for run_id in os.listdir(store_dir)}
+    runs = [run_id for run_id, path in stats_paths.items() if os.path.exists(path)]
+    return sorted(runs, key=lambda run_id: os.path.getmtime(stats_paths[run_id]), reverse=True)
+
+
+def load_run_table(run_id, name, store_dir='data/results', ticker=None):
+    """
+    Load an aggregated results table of a run.
+
+    Parameters:
+    run_id (str): Identifier of the run.
+    name (str): Table name, one of RESULT_TABLES.
+    store_dir (str): Root directory of the results store.
+    ticker (str): If given, only read the rows of this ticker.
+
+    Returns:
+    pd.DataFrame: Results table.
+    """
+    if name not in RESULT_TABLES:
+        raise ValueError(f"Unknown results table '{name}'. Available: {', '.join(RESULT_TABLES)}")
+    filters = [('Ticker', '==', ticker)] if ticker is not None else None
+    return pd.read_parquet(os.path.join(store_dir, run_id, f'{name}.parquet'), filters=filters)
+
+
+if __name__ == '__main__':
+    # Build the aggregates of a multi-ticker run: python src/results_store.py <run_id>
+    import sys
+    build_run_aggregates(sys.argv[1])
@@ -1,5 +1,6 @@
 import sys
 import os
+from datetime import datetime
 
 # Add the src directory to the sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
@@ -13,15 +14,26 @@ import model_training as mt
 import model_evaluation as me
 import model_predictions as mp
 import backtest as bt
+import results_store as rs
 
 
 
 # Data Download Config
-ticker = 'AMZN' 
+ticker = os.environ.get('TICKER', 'AMZN')
 start_date = '2020-01-01'
 end_date = '2021-01-01'
 file_path = f'data/raw/{ticker}_ohlcv.parquet'
 
+# Model Config - 'random_forest', 'hist_gradient_boosting' or 'elastic_net'
+model_type = 'random_forest'
+
+# Results Store Config - browse with: streamlit run src/dashboard.py
+# For a multi-ticker run, set the same RUN_ID for every ticker, e.g.
+#   for t in AAPL AMZN; do RUN_ID=my_run TICKER=$t python src/run.py; done
+#   python src/results_store.py my_run
+shared_run = 'RUN_ID' in os.environ
+run_id = os.environ.get('RUN_ID', datetime.now().strftime('%Y%m%d_%H%M%S'))
+
 
 # Extract Data from API and save in parquet file
 ohlcv = extract.extract_ohlcv_data(ticker,  start_date, end_date, file_path)
@@ -37,10 +49,10 @@ ohlcv = fe.add_technical_indicators(ohlcv)
 ohlcv_scaled = fs.scale_features(ohlcv)
 
 # Prepare data for training
-X, y = mt.prepare_data(ohlcv_scaled)
+X, y = mt.prepare_data(ohlcv_scaled, dtype='float32')
 
 # Model Training
-model, X_train, X_test, y_train, y_test = mt.train_random_forest(X, y)
+model, X_train, X_test, y_train, y_test = mt.train_model(X, y, model_type=model_type, n_jobs=-1)
 
 # Model Evaluation
 metrics, y_pred = me.evaluate_model(model, X_test, y_test)
@@ -48,16 +60,20 @@ metrics, y_pred = me.evaluate_model(model, X_test, y_test)
 # Display Metrics
 me.display_metrics(metrics)
 
-# Feature Importance
-feature_importances = fi.calculate_feature_importance(model, X)
-print(feature_importances.sort_values(ascending=False))
-fi.plot_feature_importance(feature_importances, title='Feature Importance', save_path='src/features/data/feature_importance.png')
+# Feature Importance - only for models with built-in importances (e.g. not hist_gradient_boosting)
+if fi.has_builtin_feature_importance(model):
+    feature_importances = fi.calculate_feature_importance(model, X)
+    print(feature_importances.sort_values(ascending=False))
+    fi.plot_feature_importance(feature_importances, title='Feature Importance', save_path='src/features/data/feature_importance.png')
 
 # Permutation Feature Importance
 perm_importances = fi.calculate_permutation_importance(model, X, y)
 print(perm_importances.sort_values(ascending=False))
 fi.plot_feature_importance(perm_importances, title='Permutation Feature Importance', save_path='src/features/data/permutation_feature_importance.png')
 
+if not fi.has_builtin_feature_importance(model):
+    feature_importances = perm_importances
+
 # Make Predictions
 ohlcv = mp.make_predictions(model, X, ohlcv)
 
@@ -72,10 +88,15 @@ print(ohlcv[['Predicted Return', 'Strategy Return', 'Cumulative Return']])
 portfolio = bt.vectorbt_backtest(ohlcv, size=0.025, freq='D')
 print(portfolio.stats())
 
-fig = portfolio.plot(theme='dark')
-fig.show()
+# Skipped for shared multi-ticker runs - browse those in the dashboard instead
+if not shared_run:
+    fig = portfolio.plot(theme='dark')
+    fig.show()
 
-# TO-DO: Create dashboard to display stats (using streamlit - if possible)
+# Save results - a shared multi-ticker run is aggregated once after all tickers are saved
+rs.save_ticker_results(run_id, ticker, portfolio, metrics, feature_importances)
+if not shared_run:
+    rs.build_run_aggregates(run_id)
 
 # ADDITIONAL TO-DO:
 